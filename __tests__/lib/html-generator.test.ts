@@ -0,0 +1,91 @@
+// __tests__/lib/html-generator.test.ts
+// Tests for style → HTML element mapping in SemanticHTMLGenerator
+import { SemanticHTMLGenerator } from '../../lib/html-generator';
+
+const createManifest = (styles: Record<string, string> = {}) => ({
+  version: '1.0',
+  styles,
+  fallbacks: {},
+  warnings: [],
+  vocabulary: [],
+  statistics: {
+    total_styles_found: 0,
+    mapped_styles: 0,
+    fallback_styles: 0
+  }
+});
+
+describe('SemanticHTMLGenerator style mapping', () => {
+  let generator: any;
+
+  beforeEach(() => {
+    generator = new SemanticHTMLGenerator();
+  });
+
+  const mapStyle = (styleName: string, styles: Record<string, string> = {}) =>
+    generator.mapStyleToHTMLElement(styleName, generator.buildStyleIndex(createManifest(styles)));
+
+  const convert = (styleName: string, styles: Record<string, string> = {}) =>
+    generator.convertStructureToSections(
+      [{ type: 'paragraph', style: styleName, text: 'Contingut' }],
+      createManifest(styles)
+    );
+
+  describe('fallback heuristic', () => {
+    it('should map headings to their level', () => {
+      expect(mapStyle('Heading 1')).toBe('h1');
+      expect(mapStyle('Heading 2')).toBe('h2');
+      expect(mapStyle('Heading 3')).toBe('h3');
+    });
+
+    it('should map title to h1 and subtitle to h2', () => {
+      expect(mapStyle('Title')).toBe('h1');
+      expect(mapStyle('Subtitle')).toBe('h2');
+    });
+
+    it('should prefer the heading level over title in mixed names', () => {
+      expect(mapStyle('Title Heading 2')).toBe('h2');
+    });
+
+    it('should map body and normal styles to paragraphs', () => {
+      expect(mapStyle('Body Text')).toBe('p');
+      expect(mapStyle('Normal')).toBe('p');
+    });
+
+    it('should default to p for unknown styles', () => {
+      expect(mapStyle('Custom Style')).toBe('p');
+    });
+
+    it('should default to p for styles named like Object.prototype members', () => {
+      expect(mapStyle('Constructor')).toBe('p');
+      expect(mapStyle('__proto__')).toBe('p');
+    });
+  });
+
+  describe('styleManifest lookup', () => {
+    it('should use the first manifest entry mapped to a style', () => {
+      expect(mapStyle('Custom Style', {
+        'h2.Section': 'Custom Style',
+        'p.BodyText': 'Custom Style'
+      })).toBe('h2');
+    });
+
+    it('should keep an empty base element from the manifest', () => {
+      expect(mapStyle('Heading 1', { '.Foo': 'Heading 1' })).toBe('');
+    });
+  });
+
+  describe('convertStructureToSections', () => {
+    it('should turn heading styles into section titles', () => {
+      expect(convert('Subtitle')).toEqual([
+        { title: 'Contingut', type: 'paragraph', content: '' }
+      ]);
+    });
+
+    it('should not crash on prototype-named styles', () => {
+      expect(convert('Constructor')).toEqual([
+        { type: 'paragraph', content: 'Contingut' }
+      ]);
+    });
+  });
+});
@@ -51,6 +51,17 @@ interface GenerationResult {
   warnings: string[];
 }
 
+// Heurística per subcadena, ordenada de més a menys específica
+const STYLE_ELEMENT_HEURISTICS: ReadonlyArray<readonly [string, string]> = [
+  ['heading 1', 'h1'],
+  ['heading 2', 'h2'],
+  ['heading 3', 'h3'],
+  ['subtitle', 'h2'],
+  ['title', 'h1'],
+  ['body', 'p'],
+  ['normal', 'p']
+];
+
 export class SemanticHTMLGenerator {
   private nunjucksEnv!: nunjucks.Environment;
   private templateConfig!: any;
@@ -191,7 +202,6 @@ export class SemanticHTMLGenerator {
       showHeader: true,
       showFooter: true,
       showTimestamp: true,
-      generatedTimestamp: new Date().toISOString(),
       ...variables
     };
     
@@ -199,14 +209,15 @@ export class SemanticHTMLGenerator {
   }
   
   private prepareTemplateData(data: DocumentData, styleManifest?: StyleManifest): DocumentData {
+    const now = new Date();
     const defaultData = {
       documentTitle: 'Document Textami',
       showHeader: true,
       showFooter: true,
       showMetadata: false,
       showTimestamp: true,
-      generatedDate: new Date().toLocaleDateString('ca-ES'),
-      generatedTimestamp: new Date().toISOString(),
+      generatedDate: now.toLocaleDateString('ca-ES'),
+      generatedTimestamp: now.toISOString(),
       footerText: 'Document generat amb Textami - Processament Intel·ligent de Documents'
     };
     
@@ -218,10 +229,11 @@ export class SemanticHTMLGenerator {
     styleManifest: StyleManifest
   ): DocumentSection[] {
     const sections: DocumentSection[] = [];
+    const styleIndex = this.buildStyleIndex(styleManifest);
     
     for (const element of structure) {
       if (element.type === 'paragraph' && element.text?.trim()) {
-        const htmlElement = this.mapStyleToHTMLElement(element.style, styleManifest);
+        const htmlElement = this.mapStyleToHTMLElement(element.style, styleIndex);
         
         if (htmlElement?.startsWith('h')) {
           sections.push({
@@ -247,20 +259,32 @@ export class SemanticHTMLGenerator {
     return sections;
   }
   
-  private mapStyleToHTMLElement(styleName: string, styleManifest: StyleManifest): string {
-    // Buscar en el styleManifest
+  /**
+   * Construeix l'índex invers estil Word → element HTML base del styleManifest
+   */
+  private buildStyleIndex(styleManifest: StyleManifest): Map<string, string> {
+    const styleIndex = new Map<string, string>();
+    
     for (const [htmlElement, wordStyle] of Object.entries(styleManifest.styles)) {
-      if (wordStyle === styleName) {
-        return htmlElement.split('.')[0]; // Retornar només l'element base
+      // Manté la primera coincidència, com feia la cerca lineal
+      if (!styleIndex.has(wordStyle)) {
+        styleIndex.set(wordStyle, htmlElement.split('.')[0]); // Només l'element base
       }
     }
     
+    return styleIndex;
+  }
+  
+  private mapStyleToHTMLElement(styleName: string, styleIndex: Map<string, string>): string {
+    // Buscar en el styleManifest
+    const mapped = styleIndex.get(styleName);
+    if (mapped !== undefined) return mapped;
+    
     // Fallback heuristic
     const styleLower = styleName.toLowerCase();
-    if (styleLower.includes('heading 1') || styleLower.includes('title')) return 'h1';
-    if (styleLower.includes('heading 2') || styleLower.includes('subtitle')) return 'h2';
-    if (styleLower.includes('heading 3')) return 'h3';
-    if (styleLower.includes('body') || styleLower.includes('normal')) return 'p';
+    for (const [fragment, htmlElement] of STYLE_ELEMENT_HEURISTICS) {
+      if (styleLower.includes(fragment)) return htmlElement;
+    }
     
     return 'p'; // Default fallback
   }